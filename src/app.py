@@ -16,6 +16,7 @@ import sys
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 from main import MainWindow
+from ui.welcome_screen import preload_welcome_assets
 import resources_rc
 
 from PySide6.QtCore import QCoreApplication
@@ -28,6 +29,7 @@ QCoreApplication.setApplicationName(APP_NAME)
 def main():
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(":/icons/logo.png"))
+    preload_welcome_assets()
     window = MainWindow()
     window.setWindowIcon(QIcon(":/icons/logo.png"))
     window.show()
@@ -25,6 +25,7 @@ from PySide6.QtCore import QObject, Signal
 
 from logger_config import logger
 from mail_message import MailMessage
+from message_display_store import MessageDisplayStore
 from body_parser import (
     create_file_body_content_provider,
     create_file_attachment_provider,
@@ -97,12 +98,14 @@ class EmailLoaderWorker(QObject):
     """Worker that loads emails from a mail file in a background thread.
 
     Signals:
-        finished: Emitted with the loaded emails and the file path on success.
+        finished: Emitted with the loaded emails, their selection bar display
+            strings (formatted here, off the UI thread) and the file path on
+            success.
         error: Emitted with an error type and message on failure.
             Error types: "info", "unsupported", "critical".
     """
 
-    finished = Signal(list, str)  # (emails, file_path)
+    finished = Signal(list, object, str)  # (emails, display_store, file_path)
     error = Signal(str, str)  # (error_type, error_message)
 
     def __init__(self, file_path: str):
@@ -123,7 +126,7 @@ class EmailLoaderWorker(QObject):
                 if head and not head.startswith(_MBOX_FROM_PREFIX):
                     raise ValueError("Not a valid mbox file")
                 # Truly empty or valid mbox with zero messages
-                self.finished.emit(emails, self.file_path)
+                self.finished.emit(emails, MessageDisplayStore(), self.file_path)
                 return
 
             logger.debug(f"Scanned {len(offsets)} message(s) in {self.file_path}.")
@@ -195,7 +198,9 @@ class EmailLoaderWorker(QObject):
                         exc_info=True,
                     )
 
-            self.finished.emit(emails, self.file_path)
+            self.finished.emit(
+                emails, MessageDisplayStore.from_messages(emails), self.file_path
+            )
         except ValueError:
             logger.debug(
                 f"File {self.file_path} is not a valid MBOX file by content. "
@@ -14,6 +14,7 @@
 
 from typing import Callable, Any, List, Mapping, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
 from logger_config import logger
 import re
 import email.utils
@@ -197,6 +198,12 @@ class MailMessage:
         """Returns the raw 'From' header value."""
         return self.get_header("From")
 
+    @cached_property
+    def sender_display(self) -> str:
+        """Returns the sender as shown in the selection list, without quotes."""
+        sender = self.sender or self.from_ or "Unknown Sender"
+        return sender.replace('"', "")
+
     @property
     def to(self) -> Optional[str]:
         """Returns the raw 'To' header value."""
@@ -22,7 +22,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QDialog,
 )
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtCore import Qt, QThread, QTimer
 from PySide6.QtGui import QKeySequence, QShortcut
 
 from recent_file_helper import RecentFileHelper
@@ -31,6 +31,7 @@ from ui.main_window import Ui_MainWindow
 from ui.about import AboutDialog
 from logger_config import logger
 from mail_message import MailMessage
+from message_display_store import MessageDisplayStore
 from email_loader import EmailLoaderWorker
 
 
@@ -42,11 +43,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self._connect_actions()
 
         self.emails: List[MailMessage] = []  # Initialize emails list
+        # Selection bar strings for self.emails, kept in the same order
+        self._display_store = MessageDisplayStore()
         self.active_mail_index: Optional[int] = (
             None  # Track currently active email index
         )
         self._loader_thread: Optional[QThread] = None
         self._loader_worker: Optional[EmailLoaderWorker] = None
+        self.loaded_file_path: Optional[str] = None
 
         self.statusBar().showMessage("Ready")
 
@@ -63,8 +67,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.show_welcome_screen()
 
         # Pre-warm the QWebEngineView so that the first real setHtml() call
-        # does not trigger a visible Chromium initialization blink.
-        self.webEngineViewHtml.setHtml("")
+        # does not trigger a visible Chromium initialization blink. This is
+        # deferred until after the welcome screen has painted so the
+        # Chromium start-up cost is paid while the user is idle.
+        QTimer.singleShot(500, self._prewarm_html_view)
 
         # Setup keyboard shortcuts for selection navigation
         self._setup_keyboard_shortcuts()
@@ -72,6 +78,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Restore saved sort settings into the UI
         self._restore_sort_settings()
 
+    def _prewarm_html_view(self) -> None:
+        """Start the HTML preview's Chromium process unless an email is already shown."""
+        if self.active_mail_index is None:
+            self.webEngineViewHtml.setHtml("")
+
     def _connect_actions(self) -> None:
         self.actionOpen.triggered.connect(self.open_file_dialog)
         self.actionReload.triggered.connect(self.reload_data)
@@ -148,15 +159,21 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self._loader_thread.start()
 
-    def _on_emails_loaded(self, emails: List[MailMessage], file_path: str) -> None:
+    def _on_emails_loaded(
+        self,
+        emails: List[MailMessage],
+        display_store: MessageDisplayStore,
+        file_path: str,
+    ) -> None:
         """Handle successfully loaded emails (called on the main thread)."""
         self.emails = emails
+        self._display_store = display_store
         self._set_loading_state(False)
         if self.emails:
             logger.info(f"Loaded {len(self.emails)} emails from {file_path}.")
             self.statusBar().showMessage(f"Loaded {len(self.emails)} emails.")
             self._sort_emails()
-            self.virtualSelectionList.set_emails(self.emails)
+            self.virtualSelectionList.set_emails(self.emails, self._display_store)
             self._user_moved_header_splitter = False
             self.show_email_details(0)
             self.show_email_detail_view()
@@ -291,19 +308,15 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         - Down: select next email (index + 1) if not already at bottom
         If there is no active selection, keys do nothing.
         """
-        try:
-            key = event.key()
-        except Exception:
-            return super().keyPressEvent(event)
-
+        key = event.key()
         if key == Qt.Key.Key_Up:
-            current = getattr(self, "active_mail_index", None)
+            current = self.active_mail_index
             if current is not None and current > 0:
                 self.show_email_details(current - 1)
                 event.accept()
                 return
         elif key == Qt.Key.Key_Down:
-            current = getattr(self, "active_mail_index", None)
+            current = self.active_mail_index
             if current is not None and current < (len(self.emails) - 1):
                 self.show_email_details(current + 1)
                 event.accept()
@@ -372,7 +385,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         )
 
         self._sort_emails()
-        self.virtualSelectionList.set_emails(self.emails)
+        self.virtualSelectionList.set_emails(self.emails, self._display_store)
 
         # Restore selection to the same email after re-sorting
         if active_mail is not None:
@@ -385,7 +398,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.show_email_details(0)
 
     def _sort_emails(self) -> None:
-        """Sort self.emails in-place based on the current sort field and order settings."""
+        """Sort self.emails based on the current sort field and order settings.
+
+        The display store is permuted alongside, so the selection bar strings
+        formatted by the loader are reused instead of rebuilt.
+        """
         sort_field = SortSettingHelper.get_sort_field()
         sort_order = SortSettingHelper.get_sort_order()
         reverse = sort_order == SortOrder.DESCENDING
@@ -401,14 +418,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         }
         key_func = key_funcs.get(sort_field, key_funcs[SortField.DATE])
 
-        self.emails.sort(key=key_func, reverse=reverse)
+        emails = self.emails
+        order = sorted(
+            range(len(emails)), key=lambda i: key_func(emails[i]), reverse=reverse
+        )
+        self.emails = [emails[i] for i in order]
+        self._display_store = self._display_store.reordered(order)
         logger.debug(
             f"Sorted {len(self.emails)} emails by {sort_field.value} ({sort_order.value})"
         )
 
     def reload_data(self):
         logger.debug("Reload data action triggered")
-        if hasattr(self, "loaded_file_path") and self.loaded_file_path:
+        if self.loaded_file_path:
             logger.info(f"Reloading data from: {self.loaded_file_path}")
             self.open_file(self.loaded_file_path)
         else:
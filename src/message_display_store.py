@@ -0,0 +1,81 @@
+# Copyright 2026 Chan Alston
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Display strings for the selection bar list, kept as parallel lists indexed
+by row so a bar can be bound to a row without formatting anything.
+"""
+
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import List, Optional
+
+from mail_message import MailMessage
+from utils import format_bytes
+
+
+@lru_cache(maxsize=4096)
+def _format_date_display(date_header: datetime, tz: Optional[tzinfo]) -> str:
+    # tz is part of the key because datetimes for the same instant in
+    # different zones compare equal but display different wall-clock times
+    # Fixed ASCII layout, so skip strftime's locale-aware formatting
+    return (
+        f"{date_header.year:04d}/{date_header.month:02d}/{date_header.day:02d} "
+        f"{date_header.hour:02d}:{date_header.minute:02d}"
+    )
+
+
+class MessageDisplayStore:
+    """
+    Precomputed sender, subject, date and size strings for a list of emails.
+    Entry i of each list belongs to the email at row i.
+    """
+
+    def __init__(self) -> None:
+        self.senders: List[str] = []
+        self.subjects: List[str] = []
+        self.dates: List[str] = []
+        self.sizes: List[str] = []
+
+    @classmethod
+    def from_messages(cls, mail_messages: List[MailMessage]) -> "MessageDisplayStore":
+        """Format the display strings for every message, in list order."""
+        store = cls()
+        senders = store.senders
+        subjects = store.subjects
+        dates = store.dates
+        sizes = store.sizes
+        for mail_message in mail_messages:
+            senders.append(mail_message.sender_display)
+            subjects.append(mail_message.subject or "No Subject")
+            date_header = mail_message.date_header
+            dates.append(
+                _format_date_display(date_header, date_header.tzinfo)
+                if date_header
+                else (mail_message.date or "No Date")
+            )
+            sizes.append(format_bytes(mail_message.size))
+        return store
+
+    def reordered(self, order: List[int]) -> "MessageDisplayStore":
+        """Return a store whose row i holds this store's row order[i]."""
+        store = MessageDisplayStore()
+        store.senders = [self.senders[i] for i in order]
+        store.subjects = [self.subjects[i] for i in order]
+        store.dates = [self.dates[i] for i in order]
+        store.sizes = [self.sizes[i] for i in order]
+        return store
+
+    def __len__(self) -> int:
+        return len(self.senders)
@@ -67,7 +67,6 @@ class AboutDialog(object):
         sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelLogo.sizePolicy().hasHeightForWidth())
         self.labelLogo.setSizePolicy(sizePolicy)
         font = QFont()
         font.setPointSize(17)
@@ -93,7 +92,6 @@ class AboutDialog(object):
         )
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelAppName.sizePolicy().hasHeightForWidth())
         self.labelAppName.setSizePolicy(sizePolicy)
         font = QFont()
         font.setFamilies(["STSong"])
@@ -138,9 +136,6 @@ class AboutDialog(object):
         )
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.labelGitHubLink.sizePolicy().hasHeightForWidth()
-        )
         self.labelGitHubLink.setSizePolicy(sizePolicy)
         font = QFont()
         font.setUnderline(True)
@@ -162,9 +157,6 @@ class AboutDialog(object):
         )
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.groupBoxLicense.sizePolicy().hasHeightForWidth()
-        )
         self.groupBoxLicense.setSizePolicy(sizePolicy)
         self.groupBoxLicense.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -188,7 +180,6 @@ class AboutDialog(object):
             "   See the License for the specific language governing permissions and\n"
             "   limitations under the License."
         )
-        sizePolicy.setHeightForWidth(self.labelLicense.sizePolicy().hasHeightForWidth())
         self.labelLicense.setSizePolicy(sizePolicy)
         self.labelLicense.setWordWrap(True)
         self.labelLicense.setTextInteractionFlags(_SELECTABLE_TEXT_FLAGS)
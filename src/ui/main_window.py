@@ -13,8 +13,8 @@
 # limitations under the License.
 
 import os
-from typing import Callable
-from PySide6.QtCore import QRect, QSize, Qt
+from typing import Callable, Optional
+from PySide6.QtCore import QCoreApplication, QRect, QSize, Qt
 from PySide6.QtGui import QAction, QActionGroup, QIcon, QKeySequence
 from PySide6.QtWidgets import (
     QFrame,
@@ -34,6 +34,11 @@ from PySide6.QtWidgets import (
     QSpacerItem,
     QToolButton,
 )
+from PySide6.QtWebEngineCore import (
+    QWebEnginePage,
+    QWebEngineProfile,
+    QWebEngineSettings,
+)
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from constants import APP_NAME
 from ui.mail_header import MailHeaderWidget
@@ -42,6 +47,36 @@ from ui.virtual_selection_list import VirtualSelectionBarList
 from ui.attachment_list import AttachmentListWidget
 from logger_config import logger
 
+# Shared off-the-record profile for HTML previews, created on first use
+_html_preview_profile: Optional[QWebEngineProfile] = None
+
+
+def get_html_preview_profile() -> QWebEngineProfile:
+    """
+    Return the profile used by HTML body previews.
+
+    Email bodies are static documents, so scripting, plugins, WebGL and
+    storage are switched off and the HTTP cache is kept in memory.
+    """
+    global _html_preview_profile
+    if _html_preview_profile is None:
+        profile = QWebEngineProfile(QCoreApplication.instance())
+        profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.MemoryHttpCache)
+        profile.setPersistentCookiesPolicy(
+            QWebEngineProfile.PersistentCookiesPolicy.NoPersistentCookies
+        )
+        settings = profile.settings()
+        for attribute in (
+            QWebEngineSettings.WebAttribute.JavascriptEnabled,
+            QWebEngineSettings.WebAttribute.PluginsEnabled,
+            QWebEngineSettings.WebAttribute.WebGLEnabled,
+            QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled,
+            QWebEngineSettings.WebAttribute.LocalStorageEnabled,
+        ):
+            settings.setAttribute(attribute, False)
+        _html_preview_profile = profile
+    return _html_preview_profile
+
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -133,9 +168,6 @@ class Ui_MainWindow(object):
         )
         mainSplitterSizePolicy.setHorizontalStretch(100)
         mainSplitterSizePolicy.setVerticalStretch(0)
-        mainSplitterSizePolicy.setHeightForWidth(
-            self.splitterMain.sizePolicy().hasHeightForWidth()
-        )
         self.splitterMain.setSizePolicy(mainSplitterSizePolicy)
         self.splitterMain.setOrientation(Qt.Orientation.Horizontal)
 
@@ -160,7 +192,6 @@ class Ui_MainWindow(object):
         )
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.toolbarFrame.sizePolicy().hasHeightForWidth())
 
         self.toolbarFrame.setSizePolicy(sizePolicy)
         self.toolbarFrame.setMinimumSize(QSize(0, 35))
@@ -292,9 +323,6 @@ class Ui_MainWindow(object):
         )
         # rightFrameSizePolicy.setHorizontalStretch(0)
         rightFrameSizePolicy.setVerticalStretch(0)
-        rightFrameSizePolicy.setHeightForWidth(
-            self.frameRight.sizePolicy().hasHeightForWidth()
-        )
         self.frameRight.setSizePolicy(rightFrameSizePolicy)
         self.frameRight.setFrameShape(QFrame.Shape.StyledPanel)
         self.frameRight.setFrameShadow(QFrame.Shadow.Raised)
@@ -336,9 +364,6 @@ class Ui_MainWindow(object):
         )
         mailHeaderFrameSizePolicy.setHorizontalStretch(0)
         mailHeaderFrameSizePolicy.setVerticalStretch(25)
-        mailHeaderFrameSizePolicy.setHeightForWidth(
-            self.frameMailHeader.sizePolicy().hasHeightForWidth()
-        )
         self.frameMailHeader.setSizePolicy(mailHeaderFrameSizePolicy)
         self.frameMailHeader.setMinimumSize(QSize(200, 20))
         self.frameMailHeader.setFrameShape(QFrame.Shape.StyledPanel)
@@ -376,9 +401,6 @@ class Ui_MainWindow(object):
         )
         mailBodyTabSizePolicy.setHorizontalStretch(0)
         mailBodyTabSizePolicy.setVerticalStretch(75)
-        mailBodyTabSizePolicy.setHeightForWidth(
-            self.tabMailBody.sizePolicy().hasHeightForWidth()
-        )
         self.tabMailBody.setSizePolicy(mailBodyTabSizePolicy)
         self.tabMailBody.setMinimumSize(QSize(200, 20))
         self.tabMailBody.setTabShape(QTabWidget.TabShape.Rounded)
@@ -392,6 +414,9 @@ class Ui_MainWindow(object):
         self.htmlBodyLayout.setContentsMargins(0, 0, 0, 0)
         self.webEngineViewHtml = QWebEngineView(self.tabHtml)
         self.webEngineViewHtml.setObjectName("webEngineViewHtml")
+        self.webEngineViewHtml.setPage(
+            QWebEnginePage(get_html_preview_profile(), self.webEngineViewHtml)
+        )
         self.webEngineViewHtml.setContentsMargins(1, 1, 1, 1)
         self.htmlBodyLayout.addWidget(self.webEngineViewHtml)
 
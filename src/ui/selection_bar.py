@@ -12,35 +12,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import cast
-from PySide6.QtCore import Qt, Signal, QObject, QEvent
-from PySide6.QtGui import QFont, QMouseEvent, QEnterEvent
-from PySide6.QtWidgets import (
-    QFormLayout,
-    QFrame,
-    QGridLayout,
-    QHBoxLayout,
-    QLabel,
-    QLayout,
-    QSizePolicy,
-    QSpacerItem,
-    QWidget,
+from PySide6.QtCore import Qt, Signal, QEvent, QSize
+from PySide6.QtGui import (
+    QEnterEvent,
+    QFont,
+    QFontMetrics,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPalette,
+    QPen,
+    QResizeEvent,
 )
+from PySide6.QtWidgets import QApplication, QSizePolicy, QWidget
 
-from mail_message import MailMessage
-from utils import format_bytes
-from ui.common.ellipsis_label import EllipsisLabel
+from message_display_store import MessageDisplayStore
 from logger_config import logger
 
+# Shared by every selection bar; setFont copies it on assignment
+_TEXT_FONT = QFont()
+_TEXT_FONT.setPointSize(8)
+# Space between the frame edge and the text
+_MARGIN = 6
+# Gap between the two text rows
+_ROW_SPACING = 6
+# Gap between the sender and the date
+_COLUMN_SPACING = 6
+# Gap between the subject and the size; the old subject label's right
+# padding, as the bottom row had no spacing of its own
+_SUBJECT_PADDING = 6
+_RIGHT_ALIGNED = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+def _label_width(metrics: QFontMetrics, text: str) -> int:
+    """Width a QLabel showing *text* would ask for; often a pixel over the advance."""
+    return metrics.boundingRect(0, 0, 2000, 2000, _RIGHT_ALIGNED, text).width()
+
 
 class SelectionBarWidget(QWidget):
     """
     A custom QWidget that acts as a clickable selection bar for an email.
     It displays summary information and changes appearance on hover and selection.
+
+    The four fields are drawn directly in paintEvent rather than held in child
+    labels, so binding a new row only stores strings and schedules one repaint.
     """
 
     clicked = Signal(int)  # Emits the index of this selection bar when clicked
 
+    # Shiboken still gives QWidget subclasses a __dict__ (signal instances
+    # live there), but slotted attributes skip it on every lookup
+    __slots__ = (
+        "index",
+        "_is_hovered",
+        "_is_active",
+        "_press_x",
+        "_press_y",
+        "_pressed",
+        "_sender",
+        "_subject",
+        "_date",
+        "_size",
+        "_elided_sender",
+        "_elided_subject",
+        "_elide_pending",
+    )
+
     def __init__(self, index: int, parent=None):
         super().__init__(parent)
         self.index = index
@@ -48,334 +85,188 @@ class SelectionBarWidget(QWidget):
         self._is_active = False  # Internal state for active/selected email
 
         # Track click gesture to avoid emitting on drags / text selection
-        self._press_pos = None
+        self._press_x = 0
+        self._press_y = 0
         self._pressed = False
 
+        # Text shown in the bar; the sender and subject are elided to fit
+        self._sender = "Name <email>"
+        self._subject = ""
+        self._date = "00:00 PM"
+        self._size = "7KB"
+        self._elided_sender = self._sender
+        self._elided_subject = self._subject
+        # Eliding is left to the first paint after a bind or resize, so
+        # buffer rows outside the viewport never measure their text
+        self._elide_pending = True
+
         self._setup_ui()
-        self._apply_default_style()  # Apply default style initially
 
     # --- Click handling ---
-    def _install_click_forwarding(self) -> None:
-        """Install an event filter on child widgets that commonly consume mouse events."""
-        # frameMain covers most of the area; labels may accept events (e.g., selectable text)
-        for w in [
-            getattr(self, "frameMain", None),
-            getattr(self, "labelRecipient", None),
-            getattr(self, "labelSubject", None),
-            getattr(self, "labelDateTime", None),
-            getattr(self, "labelSize", None),
-        ]:
-            if w is not None:
-                w.installEventFilter(self)
-
-    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
-        et = event.type()
-        if et in (
-            event.Type.MouseButtonPress,
-            event.Type.MouseMove,
-            event.Type.MouseButtonRelease,
-        ):
-            try:
-                mouse_event = cast(QMouseEvent, event)
-                watched_widget = cast(QWidget, watched)
-                if et == event.Type.MouseButtonPress:
-                    if mouse_event.button() == Qt.MouseButton.LeftButton:
-                        pos = watched_widget.mapTo(
-                            self, mouse_event.position().toPoint()
-                        )
-                        self._pressed = True
-                        self._press_pos = pos
-                        logger.debug(
-                            f"Mouse press at {pos} on {watched_widget.objectName()}"
-                        )
-                elif et == event.Type.MouseMove:
-                    if self._pressed and self._press_pos is not None:
-                        pos = watched_widget.mapTo(
-                            self, mouse_event.position().toPoint()
-                        )
-                        if (pos - self._press_pos).manhattanLength() >= 4:
-                            self._pressed = False
-                            logger.debug(
-                                f"Mouse move at {pos} on {watched_widget.objectName()}, cancelling click"
-                            )
-                elif et == event.Type.MouseButtonRelease:
-                    if (
-                        mouse_event.button() == Qt.MouseButton.LeftButton
-                        and self._pressed
-                    ):
-                        pos = watched_widget.mapTo(
-                            self, mouse_event.position().toPoint()
-                        )
-                        if self.rect().contains(pos):
-                            logger.debug(f"Selection bar clicked: Index {self.index}")
-                            self.clicked.emit(self.index)
-                    self._pressed = False
-                    self._press_pos = None
-            except Exception:
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position()
+            self._pressed = True
+            self._press_x = int(pos.x())
+            self._press_y = int(pos.y())
+            logger.debug(
+                f"Mouse press at ({self._press_x}, {self._press_y}) on {self.objectName()}"
+            )
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self._pressed:
+            # Plain int arithmetic; no QPoint temporaries per move event
+            pos = event.position()
+            if (
+                abs(int(pos.x()) - self._press_x) + abs(int(pos.y()) - self._press_y)
+                >= 4
+            ):
                 self._pressed = False
-                self._press_pos = None
-                logger.error(
-                    "Error in eventFilter for click forwarding",
-                    exc_info=True,
-                )
-            return False
-        return super().eventFilter(watched, event)
+                logger.debug(f"Mouse move at {pos}, cancelling click")
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton and self._pressed:
+            if self.rect().contains(event.position().toPoint()):
+                logger.debug(f"Selection bar clicked: Index {self.index}")
+                self.clicked.emit(self.index)
+        self._pressed = False
+        super().mouseReleaseEvent(event)
 
     def _setup_ui(self):
         if not self.objectName():
             self.setObjectName("SelectionBarWidget")
 
-        self._setup_base_widget_properties()
-        self._setup_main_frame_and_layouts()
-        self._setup_labels()
-        self._install_click_forwarding()
-
-    def _setup_base_widget_properties(self):
         self.setWindowModality(Qt.WindowModality.NonModal)
         # Allow the selection bar to receive focus so keyboard navigation can set focus
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.PreventContextMenu)
-        self.setMouseTracking(
-            True
-        )  # Enable mouse tracking for hover events on the widget itself
+        # No mouse tracking: hover comes from enter/leave events, and Qt
+        # delivers move events during a press (drag cancel) without it
         self.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
         )  # Allow horizontal expansion, but not forcing
         self.setMinimumWidth(1)  # Allow to shrink very small if needed
-
-    def _setup_main_frame_and_layouts(self):
-        # Setup gridLayout first, as frameMain will be added to it
-        self.gridLayout = QGridLayout(self)
-        self.gridLayout.setObjectName("gridLayout")
-        self.gridLayout.setContentsMargins(0, 0, 0, 0)
-
-        # Setup frameMain
-        self.frameMain = QFrame(self)
-        self.frameMain.setObjectName("frameMain")
-        sizePolicy = QSizePolicy(
-            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
-        )
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.frameMain.sizePolicy().hasHeightForWidth())
-        self.frameMain.setSizePolicy(sizePolicy)
-        self.frameMain.setAutoFillBackground(False)
-        self.frameMain.setFrameShape(QFrame.Shape.Box)
-        self.frameMain.setFrameShadow(QFrame.Shadow.Plain)
-        self.frameMain.setMouseTracking(True)  # Enable mouse tracking for frameMain
-
-        # Add frameMain to gridLayout
-        self.gridLayout.addWidget(self.frameMain, 0, 0, 1, 1)
-
-        # Setup formLayout (parented to frameMain)
-        self.formLayout = QFormLayout(self.frameMain)
-        self.formLayout.setObjectName("formLayout")
-        self.formLayout.setVerticalSpacing(3)
-        self.formLayout.setContentsMargins(4, 4, 4, 4)
-
-        # Setup hBoxLayoutTop
-        self.hBoxLayoutTop = QHBoxLayout()
-        self.hBoxLayoutTop.setSpacing(6)
-        self.hBoxLayoutTop.setObjectName("hBoxLayoutTop")
-        self.hBoxLayoutTop.setSizeConstraint(
-            QLayout.SizeConstraint.SetDefaultConstraint
-        )
-        self.hBoxLayoutTop.setContentsMargins(-1, -1, -1, 0)
-
-        # Setup spacerVertical
-        self.spacerVertical = QSpacerItem(
-            0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding
+        # paintEvent covers every pixel, so Qt need not paint what is behind
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setFont(_TEXT_FONT)
+
+    @staticmethod
+    def bar_height() -> int:
+        """Height every bar needs: two text rows plus margins and spacing."""
+        # Resolve like setFont does: only the point size is ours
+        font = _TEXT_FONT.resolve(QApplication.font())
+        return 2 * _MARGIN + 2 * QFontMetrics(font).height() + _ROW_SPACING
+
+    def sizeHint(self) -> QSize:
+        metrics = self.fontMetrics()
+        width = 2 * _MARGIN + max(
+            _label_width(metrics, self._sender)
+            + _COLUMN_SPACING
+            + _label_width(metrics, self._date),
+            _label_width(metrics, self._subject)
+            + _SUBJECT_PADDING
+            + _label_width(metrics, self._size),
         )
-
-        # Setup hBoxLayoutBottom
-        self.hBoxLayoutBottom = QHBoxLayout()
-        self.hBoxLayoutBottom.setObjectName("hBoxLayoutBottom")
-        self.hBoxLayoutBottom.setSizeConstraint(
-            QLayout.SizeConstraint.SetDefaultConstraint
-        )
-
-    def _setup_labels(self):
-        font = QFont()
-        font.setPointSize(8)
-
-        sizePolicy1 = QSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
-        )
-        sizePolicy1.setHorizontalStretch(0)
-        sizePolicy1.setVerticalStretch(0)
-
-        # Label Recipient
-        self.labelRecipient = EllipsisLabel("", self.frameMain)
-        self.labelRecipient.setObjectName("labelRecipient")
-        sizePolicy1.setHeightForWidth(
-            self.labelRecipient.sizePolicy().hasHeightForWidth()
+        return QSize(width, self.bar_height())
+
+    def _elide_text(self) -> None:
+        """Fit the sender and subject into the space the date and size leave."""
+        metrics = self.fontMetrics()
+        inner_width = self.width() - 2 * _MARGIN
+
+        # The date and size keep the width their labels used to ask for, so
+        # the text elides at the same character as it did with labels
+        sender_width = inner_width - _COLUMN_SPACING - _label_width(metrics, self._date)
+        self._elided_sender = metrics.elidedText(
+            self._sender, Qt.TextElideMode.ElideRight, max(sender_width, 0)
         )
-        self.labelRecipient.setSizePolicy(sizePolicy1)
-        self.labelRecipient.setFont(font)
-        self.labelRecipient.setAutoFillBackground(False)
-        self.labelRecipient.setMargin(0)
-        self.labelRecipient.setText("Name <email>")
-        self.labelRecipient.setTextInteractionFlags(
-            Qt.TextInteractionFlag.NoTextInteraction
-        )
-        self.hBoxLayoutTop.addWidget(self.labelRecipient)
-
-        # Label DateTime
-        self.labelDateTime = QLabel(self.frameMain)
-        self.labelDateTime.setObjectName("labelDateTime")
-        sizePolicy = QSizePolicy(
-            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
-        )
-        sizePolicy.setHeightForWidth(
-            self.labelDateTime.sizePolicy().hasHeightForWidth()
-        )
-        self.labelDateTime.setSizePolicy(sizePolicy)
-        self.labelDateTime.setFont(font)
-        self.labelDateTime.setText("00:00 PM")
-        self.labelDateTime.setAlignment(
-            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop
-        )
-        self.hBoxLayoutTop.addWidget(self.labelDateTime)
 
-        self.formLayout.setLayout(
-            0, QFormLayout.ItemRole.SpanningRole, self.hBoxLayoutTop
+        subject_width = (
+            inner_width - _SUBJECT_PADDING - _label_width(metrics, self._size)
         )
-        self.formLayout.setItem(
-            1, QFormLayout.ItemRole.SpanningRole, self.spacerVertical
-        )
-
-        # Label Subject
-        self.labelSubject = EllipsisLabel("", self.frameMain)
-        self.labelSubject.setWordWrap(False)
-        self.labelSubject.setObjectName("labelSubject")
-        sizePolicy1.setHeightForWidth(
-            self.labelSubject.sizePolicy().hasHeightForWidth()
-        )
-        self.labelSubject.setSizePolicy(sizePolicy1)
-        self.labelSubject.setFont(font)
-        self.labelSubject.setAutoFillBackground(False)
-        self.labelSubject.setMargin(0)
-
-        self.hBoxLayoutBottom.addWidget(self.labelSubject)
-
-        self.labelSubject.setAlignment(
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-        )
-        # Do not allow text selection on subject label either
-        self.labelSubject.setTextInteractionFlags(
-            Qt.TextInteractionFlag.NoTextInteraction
-        )
-        self.labelSubject.setStyleSheet("padding-right: 6px;")
-
-        # Label Size
-        self.labelSize = QLabel(self.frameMain)
-        self.labelSize.setObjectName("labelSize")
-        sizePolicy = QSizePolicy(
-            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
-        )
-        sizePolicy.setHeightForWidth(self.labelSize.sizePolicy().hasHeightForWidth())
-        self.labelSize.setSizePolicy(sizePolicy)
-        self.labelSize.setFont(font)
-        self.labelSize.setText("7KB")
-        self.labelSize.setAlignment(
-            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop
-        )
-        self.hBoxLayoutBottom.addWidget(self.labelSize)
-
-        self.formLayout.setLayout(
-            2, QFormLayout.ItemRole.SpanningRole, self.hBoxLayoutBottom
-        )
-
-    def _apply_default_style(self):
-        self.frameMain.setStyleSheet(
-            """
-            QFrame#frameMain {
-                border: 2px solid palette(mid);
-                border-radius: 4px;
-                background-color: palette(mid);
-                color: palette(mid-text);
-            }
-            QFrame#frameMain * {
-                background: transparent;
-            }
-            """
-        )
-
-    def _apply_hover_style(self):
-        self.frameMain.setStyleSheet(
-            """
-                QFrame#frameMain {
-                    border: 2px solid palette(highlight);
-                    border-radius: 4px;
-                    background-color: palette(alternate-base);
-                    color: palette(window-text);
-                }
-                QFrame#frameMain * {
-                    background: transparent;
-                }
-            """
-        )
-
-    def _apply_active_style(self):
-        self.frameMain.setStyleSheet(
-            """
-                QFrame#frameMain {
-                    border: 2px solid palette(highlight);
-                    border-radius: 4px;
-                    background-color: palette(highlight);
-                    color: palette(window-text);
-                }
-                QFrame#frameMain * {
-                    background: transparent;
-                }
-            """
+        self._elided_subject = metrics.elidedText(
+            self._subject, Qt.TextElideMode.ElideRight, max(subject_width, 0)
         )
+        self._elide_pending = False
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._elide_pending = True
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Draw the rounded frame in the colours of the current state, then the text."""
+        palette = self.palette()
+        if self._is_active:
+            border = palette.color(QPalette.ColorRole.Highlight)
+            fill = border
+        elif self._is_hovered:
+            border = palette.color(QPalette.ColorRole.Highlight)
+            fill = palette.color(QPalette.ColorRole.AlternateBase)
+        else:
+            border = palette.color(QPalette.ColorRole.Mid)
+            fill = border
+
+        painter = QPainter(self)
+        # The corners outside the frame show the list's background colour
+        painter.fillRect(self.rect(), palette.color(QPalette.ColorRole.Shadow))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(fill)
+        painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 4, 4)
+
+        text_height = self.fontMetrics().height()
+        top_row = self.rect().adjusted(_MARGIN, _MARGIN, -_MARGIN, 0)
+        top_row.setHeight(text_height)
+        bottom_row = top_row.translated(0, text_height + _ROW_SPACING)
+
+        if self._elide_pending:
+            self._elide_text()
+        painter.setPen(palette.color(QPalette.ColorRole.WindowText))
+        left = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        painter.drawText(top_row, left, self._elided_sender)
+        painter.drawText(top_row, _RIGHT_ALIGNED, self._date)
+        painter.drawText(bottom_row, left, self._elided_subject)
+        painter.drawText(bottom_row, _RIGHT_ALIGNED, self._size)
 
     def set_active(self, active: bool) -> None:
         """
         Sets the active state of the selection bar.
-        When active, it uses the active style; otherwise, it determines style based on hover state.
+        When active, it is painted in the active colours; otherwise, the hover state decides.
         """
+        if active == self._is_active:
+            return
         self._is_active = active
-        if active:
-            self._apply_active_style()
-        else:
-            # If no longer active, re-apply hover or default based on current mouse position
-            if self._is_hovered:
-                self._apply_hover_style()
-            else:
-                self._apply_default_style()
+        self.update()
 
     def enterEvent(self, event: QEnterEvent) -> None:
         """Event handler for mouse entering the widget area."""
         self._is_hovered = True
-        if not self._is_active:  # Only apply hover if not active
-            self._apply_hover_style()
+        if not self._is_active:  # Only repaint for hover if not active
+            self.update()
         super().enterEvent(event)
 
     def leaveEvent(self, event: QEvent) -> None:
         """Event handler for mouse leaving the widget area."""
         self._is_hovered = False
-        if not self._is_active:  # Only apply default if not active
-            self._apply_default_style()
+        if not self._is_active:  # Only repaint for hover if not active
+            self.update()
         super().leaveEvent(event)
 
-    def set_email_data(self, mail_message: MailMessage) -> None:
+    def rebind(self, row: int, store: MessageDisplayStore, active: bool) -> None:
         """
-        Populates the selection bar labels with data from a MailMessage object.
+        Shows the email at *row* of *store*; the strings are already formatted.
+        Used both for fresh bars and for bars recycled from another row.
         """
-        sender_display = mail_message.sender or mail_message.from_ or "Unknown Sender"
-        sender_display = sender_display.replace('"', "")
-
-        subject_display = mail_message.subject or "No Subject"
-        date_display = (
-            mail_message.date_header.strftime("%Y/%m/%d %H:%M")
-            if mail_message.date_header
-            else (mail_message.date or "No Date")
-        )
-        size_display = format_bytes(mail_message.size)
-
-        self.labelRecipient.setText(sender_display)
-        self.labelSubject.setText(subject_display)
-        self.labelDateTime.setText(date_display)
-        self.labelSize.setText(size_display)
+        self.index = row
+        self._is_active = active
+        # A recycled bar may have been hidden mid-hover or mid-press
+        self._is_hovered = False
+        self._pressed = False
+        self._sender = store.senders[row]
+        self._subject = store.subjects[row]
+        self._date = store.dates[row]
+        self._size = store.sizes[row]
+        self._elide_pending = True
+        self.update()
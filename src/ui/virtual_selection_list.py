@@ -21,21 +21,25 @@ emails are loaded, eliminating the multi-second freeze that occurred when
 creating thousands of widgets at once.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QPainter, QPalette
 from PySide6.QtWidgets import (
     QAbstractScrollArea,
     QWidget,
 )
 
 from mail_message import MailMessage
+from message_display_store import MessageDisplayStore
 from ui.selection_bar import SelectionBarWidget
 
 # How many extra rows to render above/below the visible area
 _BUFFER_ROWS = 4
 # Padding at the top of the viewport before the first row
 _TOP_PADDING = 4
+# Left/right padding inside the viewport
+_ROW_MARGIN = 4
 
 
 class VirtualSelectionBarList(QAbstractScrollArea):
@@ -49,6 +53,9 @@ class VirtualSelectionBarList(QAbstractScrollArea):
 
     itemClicked = Signal(int)
 
+    # Row height shared by every list; the bars all look the same
+    _cached_row_height: Optional[int] = None
+
     # ------------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------------
@@ -57,32 +64,57 @@ class VirtualSelectionBarList(QAbstractScrollArea):
 
         # Data
         self._emails: List[MailMessage] = []
-        self._row_height: int = 0  # measured once from a prototype widget
+        # Display strings for every row, formatted once per set_emails
+        self._store = MessageDisplayStore()
+        self._row_height: int = 0  # measured from font metrics on first show
         self._active_index: Optional[int] = None
 
-        # Pool of recycled widgets – keyed by logical row index currently
-        # assigned.  value = (row_index, widget)
-        self._pool: dict[int, SelectionBarWidget] = {}
+        # Widgets currently showing a row, keyed by that row index
+        self._active: dict[int, SelectionBarWidget] = {}
+        # Hidden widgets waiting to be rebound to a row that scrolls in
+        self._free: List[SelectionBarWidget] = []
+        # Row range bound by the last layout pass; None forces a full pass
+        self._last_range: Optional[Tuple[int, int]] = None
+
+        # Scroll events only schedule a layout pass; a burst of them within
+        # one event-loop iteration collapses into a single pass
+        self._layout_pending = False
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.setInterval(0)
+        self._layout_timer.timeout.connect(self._layout_visible)
+
+        # The scroll area keeps the same scrollbar for its whole life
+        self._vbar = self.verticalScrollBar()
 
         # Appearance
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
-        # The viewport itself needs a layout-less background
-        self.viewport().setStyleSheet(
-            "background-color: palette(shadow);" "border-radius: 10px;"
-        )
-
-        # Measure row height from a temporary prototype
-        self._measure_row_height()
+        # paintEvent draws the rounded background, so the viewport needs
+        # neither a stylesheet nor its default Base fill
+        self.viewport().setAutoFillBackground(False)
+        # The row height is measured on first show (see showEvent)
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
-    def set_emails(self, emails: List[MailMessage]) -> None:
-        """Replace the entire data set and refresh the view."""
+    def set_emails(
+        self,
+        emails: List[MailMessage],
+        store: Optional[MessageDisplayStore] = None,
+    ) -> None:
+        """Replace the entire data set and refresh the view.
+
+        *store* holds the display strings for *emails* in the same order;
+        it is built here when the caller has not prepared one.
+        """
         self._emails = emails
+        self._store = (
+            store if store is not None else MessageDisplayStore.from_messages(emails)
+        )
         self._active_index = None
+        self._last_range = None
         self._recycle_all()
         self._update_scrollbar()
         self._layout_visible()
@@ -93,10 +125,10 @@ class VirtualSelectionBarList(QAbstractScrollArea):
         self._active_index = index
 
         # Update styling on widgets that are currently materialised
-        if prev is not None and prev in self._pool:
-            self._pool[prev].set_active(False)
-        if index is not None and index in self._pool:
-            self._pool[index].set_active(True)
+        if prev is not None and prev in self._active:
+            self._active[prev].set_active(False)
+        if index is not None and index in self._active:
+            self._active[index].set_active(True)
 
     def get_active_index(self) -> Optional[int]:
         return self._active_index
@@ -105,7 +137,7 @@ class VirtualSelectionBarList(QAbstractScrollArea):
         """Ensure *index* is visible with one row of context above/below."""
         if not self._emails or index < 0 or index >= len(self._emails):
             return
-        vbar = self.verticalScrollBar()
+        vbar = self._vbar
         vp_h = self.viewport().height()
         current = vbar.value()
 
@@ -131,79 +163,129 @@ class VirtualSelectionBarList(QAbstractScrollArea):
     # Internals
     # ------------------------------------------------------------------
     def _measure_row_height(self) -> None:
-        """Create a throw-away SelectionBarWidget to find out how tall one row is."""
-        proto = SelectionBarWidget(0, None)
-        proto.adjustSize()
-        h = proto.sizeHint().height()
-        self._row_height = max(h, 30) + 5
-        proto.deleteLater()
+        """Work out how tall one row is from the bar's font metrics.
+
+        The result is kept on the class, so only the first list pays for it.
+        """
+        cls = type(self)
+        if cls._cached_row_height is None:
+            cls._cached_row_height = max(SelectionBarWidget.bar_height(), 30) + 5
+        self._row_height = cls._cached_row_height
 
     def _update_scrollbar(self) -> None:
         total_height = _TOP_PADDING + len(self._emails) * self._row_height
         vp_h = self.viewport().height()
-        vbar = self.verticalScrollBar()
+        vbar = self._vbar
         vbar.setRange(0, max(0, total_height - vp_h))
         vbar.setPageStep(vp_h)
         vbar.setSingleStep(self._row_height)
 
     def _visible_range(self):
         """Return (first_row, last_row_exclusive) that should be rendered."""
-        if not self._emails:
+        # Runs on every scroll step, so everything is read into locals once
+        row_height = self._row_height
+        count = len(self._emails)
+        if not count or not row_height:
             return 0, 0
-        vbar = self.verticalScrollBar()
-        scroll_y = vbar.value()
+        scroll_y = self._vbar.value()
         vp_h = self.viewport().height()
 
-        first = max(0, scroll_y // self._row_height - _BUFFER_ROWS)
-        last = min(
-            len(self._emails),
-            (scroll_y + vp_h) // self._row_height + 1 + _BUFFER_ROWS,
-        )
-        return first, last
+        first = scroll_y // row_height - _BUFFER_ROWS
+        last = (scroll_y + vp_h) // row_height + 1 + _BUFFER_ROWS
+        return (0 if first < 0 else first), (count if last > count else last)
+
+    def _free_cap(self) -> int:
+        """Most idle widgets worth keeping: one window of rows plus buffers."""
+        if not self._row_height:
+            return 0
+        return self.viewport().height() // self._row_height + 1 + 2 * _BUFFER_ROWS
+
+    def _park(self, w: SelectionBarWidget, free_cap: int) -> None:
+        """Hide *w* and keep it for reuse, or delete it if enough are kept."""
+        w.hide()
+        if len(self._free) < free_cap:
+            self._free.append(w)
+        else:
+            w.deleteLater()
 
     def _recycle_all(self) -> None:
-        """Hide and remove all pooled widgets."""
-        for w in self._pool.values():
-            w.hide()
-            w.deleteLater()
-        self._pool.clear()
+        """Park every bound widget so the next layout pass can rebind it."""
+        free_cap = self._free_cap()
+        for w in self._active.values():
+            w.index = -1
+            self._park(w, free_cap)
+        self._active.clear()
+
+    def _schedule_layout(self) -> None:
+        """Run _layout_visible once the current event burst has been handled."""
+        if not self._layout_pending:
+            self._layout_pending = True
+            self._layout_timer.start()
 
     def _layout_visible(self) -> None:
         """Create / reposition widgets for the currently visible rows."""
-        if not self._emails:
+        # Any direct call also satisfies a scheduled one
+        self._layout_pending = False
+        self._layout_timer.stop()
+
+        if not self._emails or not self._row_height:
             return
 
         first, last = self._visible_range()
-        needed = set(range(first, last))
 
-        # 1. Remove widgets that scrolled out of range
-        stale = [idx for idx in self._pool if idx not in needed]
-        for idx in stale:
-            w = self._pool.pop(idx)
-            w.hide()
-            w.deleteLater()
-
-        # 2. Create widgets for newly visible rows
-        scroll_y = self.verticalScrollBar().value()
-        vp_w = self.viewport().width()
-        margin = 4  # left/right padding inside the viewport
-
-        for row in range(first, last):
-            if row in self._pool:
-                # Already exists – just reposition
-                w = self._pool[row]
-            else:
-                # Create a new widget
-                w = SelectionBarWidget(row, self.viewport())
-                w.set_email_data(self._emails[row])
-                w.clicked.connect(self._on_item_clicked)
-                if row == self._active_index:
-                    w.set_active(True)
-                self._pool[row] = w
-
-            y = _TOP_PADDING + row * self._row_height - scroll_y
-            w.setGeometry(margin, y, vp_w - 2 * margin, self._row_height - 5)
-            w.show()
+        # Loop invariants are computed once instead of per row
+        row_height = self._row_height
+        row_width = self.viewport().width() - 2 * _ROW_MARGIN
+        bar_height = row_height - 5
+        y_origin = _TOP_PADDING - self._vbar.value()
+
+        # Same rows as last time: the bars only need to follow the scroll.
+        # A resize always forces a full pass, so their size is still right
+        # and move() spares Qt the resize half of setGeometry.
+        if (first, last) == self._last_range:
+            for row, w in self._active.items():
+                w.move(_ROW_MARGIN, y_origin + row * row_height)
+            return
+        self._last_range = (first, last)
+
+        viewport = self.viewport()
+        free_cap = self._free_cap()
+
+        # Hold back viewport repaints so the whole pass lands in one frame
+        viewport.setUpdatesEnabled(False)
+        try:
+            # 1. Park widgets that scrolled out of range for reuse
+            stale = [idx for idx in self._active if idx < first or idx >= last]
+            for idx in stale:
+                self._park(self._active.pop(idx), free_cap)
+
+            # 2. Bind widgets to newly visible rows, reusing parked ones first
+            newly_bound: List[SelectionBarWidget] = []
+            for row in range(first, last):
+                w = self._active.get(row)
+                if w is None:
+                    if self._free:
+                        w = self._free.pop()
+                    else:
+                        w = SelectionBarWidget(-1, viewport)
+                        # The bar emits its current row, so one connection
+                        # survives any number of rebinds
+                        w.clicked.connect(self._on_item_clicked)
+                    w.rebind(row, self._store, row == self._active_index)
+                    self._active[row] = w
+                    newly_bound.append(w)
+
+                y = y_origin + row * row_height
+                if w.width() == row_width and w.height() == bar_height:
+                    w.move(_ROW_MARGIN, y)
+                else:
+                    w.setGeometry(_ROW_MARGIN, y, row_width, bar_height)
+
+            # 3. Show new bars only once every bar is in its final place
+            for w in newly_bound:
+                w.show()
+        finally:
+            viewport.setUpdatesEnabled(True)
 
     def _on_item_clicked(self, index: int) -> None:
         self.itemClicked.emit(index)
@@ -213,22 +295,43 @@ class VirtualSelectionBarList(QAbstractScrollArea):
     # ------------------------------------------------------------------
     def scrollContentsBy(self, dx: int, dy: int) -> None:
         # Called by QAbstractScrollArea when the scrollbar moves
-        self._layout_visible()
+        if self._layout_pending:
+            return  # the scheduled pass places every bar from scratch
+        if self._visible_range() == self._last_range:
+            # Same rows bound: scroll() shifts the bars along with the
+            # viewport and lets Qt blit the pixels where it can
+            self.viewport().scroll(0, dy)
+            return
+        self._schedule_layout()
+
+    def showEvent(self, event) -> None:
+        # Deferred from __init__ so a list that is never shown never
+        # measures; emails set while hidden are laid out now
+        if not self._row_height:
+            self._measure_row_height()
+            self._update_scrollbar()
+            self._layout_visible()
+        super().showEvent(event)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
+        self._last_range = None
+        # The scrollbar range is cheap and must track the size at once;
+        # the bar pass runs once after a burst of interactive resizes
         self._update_scrollbar()
-        self._layout_visible()
+        self._schedule_layout()
 
     def paintEvent(self, event) -> None:
-        # We don't paint anything ourselves — the child widgets do the job.
-        # But we must override to prevent QAbstractScrollArea from filling
-        # the viewport with the default background.
-        pass
+        # Only the rounded background is ours; the bars paint themselves
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.palette().color(QPalette.ColorRole.Shadow))
+        painter.drawRoundedRect(self.viewport().rect(), 10, 10)
 
     def wheelEvent(self, event) -> None:
         # Forward wheel events to the vertical scrollbar
-        vbar = self.verticalScrollBar()
+        vbar = self._vbar
         delta = event.angleDelta().y()
         vbar.setValue(vbar.value() - delta)
         event.accept()
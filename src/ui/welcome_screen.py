@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Optional
+
 from PySide6.QtCore import (
     QCoreApplication,
     QMetaObject,
@@ -23,6 +25,7 @@ from PySide6.QtGui import (
     QFont,
     QIcon,
     QPixmap,
+    QPixmapCache,
 )
 from PySide6.QtWidgets import (
     QGridLayout,
@@ -35,6 +38,58 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+# Images shown on the welcome screen, warmed into QPixmapCache at startup
+_WELCOME_PIXMAPS = (":/icons/logo.png",)
+
+# Fonts and size policies are built once; setFont/setSizePolicy copy them
+_FONT_TITLE = QFont()
+_FONT_TITLE.setPointSize(17)
+
+_FONT_TITLE_BOLD = QFont()
+_FONT_TITLE_BOLD.setFamilies(["STSong"])
+_FONT_TITLE_BOLD.setPointSize(17)
+_FONT_TITLE_BOLD.setBold(True)
+
+_FONT_DESC = QFont()
+_FONT_DESC.setPointSize(11)
+
+_SP_LOGO = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+
+_SP_TITLE = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+
+_SP_LOAD_BUTTON = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
+_SP_LOAD_BUTTON.setHorizontalStretch(76)
+_SP_LOAD_BUTTON.setVerticalStretch(30)
+
+
+def _cached_pixmap(path: str) -> QPixmap:
+    """Return the pixmap for *path*, decoding it only on the first request."""
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+
+_load_button_icon: Optional[QIcon] = None
+
+
+def _get_load_button_icon() -> QIcon:
+    """Return the shared "Load File" icon, building it on first use."""
+    global _load_button_icon
+    if _load_button_icon is None:
+        _load_button_icon = QIcon(":/icons/email_open.png")
+        _load_button_icon.addFile(
+            ":/icons/email_open.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off
+        )
+    return _load_button_icon
+
+
+def preload_welcome_assets() -> None:
+    """Decode the welcome screen images before the main window is built."""
+    for path in _WELCOME_PIXMAPS:
+        _cached_pixmap(path)
+
 
 class WelcomeFrame(object):
     def setupUi(self, WelcomeFrame):
@@ -89,15 +144,9 @@ class WelcomeFrame(object):
 
         self.labelLogo = QLabel(WelcomeFrame)
         self.labelLogo.setObjectName("labelLogo")
-        sizePolicy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelLogo.sizePolicy().hasHeightForWidth())
-        self.labelLogo.setSizePolicy(sizePolicy)
-        font = QFont()
-        font.setPointSize(17)
-        self.labelLogo.setFont(font)
-        self.labelLogo.setPixmap(QPixmap(":/icons/logo.png"))
+        self.labelLogo.setSizePolicy(_SP_LOGO)
+        self.labelLogo.setFont(_FONT_TITLE)
+        self.labelLogo.setPixmap(_cached_pixmap(":/icons/logo.png"))
         self.labelLogo.setScaledContents(True)
         self.labelLogo.setAlignment(
             Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter
@@ -113,17 +162,6 @@ class WelcomeFrame(object):
 
     def _setup_text_section(self, WelcomeFrame):
         """Set up the welcome title and description labels at row 2."""
-        font_title = QFont()
-        font_title.setPointSize(17)
-
-        font_title_bold = QFont()
-        font_title_bold.setFamilies(["STSong"])
-        font_title_bold.setPointSize(17)
-        font_title_bold.setBold(True)
-
-        font_desc = QFont()
-        font_desc.setPointSize(11)
-
         self.verticalLayoutText = QVBoxLayout()
         self.verticalLayoutText.setObjectName("verticalLayoutText")
         self.verticalLayoutText.setContentsMargins(-1, 10, -1, 10)
@@ -139,24 +177,15 @@ class WelcomeFrame(object):
 
         self.labelWelcomeTo = QLabel(WelcomeFrame)
         self.labelWelcomeTo.setObjectName("labelWelcomeTo")
-        sizePolicy = QSizePolicy(
-            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
-        )
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.labelWelcomeTo.sizePolicy().hasHeightForWidth()
-        )
-        self.labelWelcomeTo.setSizePolicy(sizePolicy)
-        self.labelWelcomeTo.setFont(font_title)
+        self.labelWelcomeTo.setSizePolicy(_SP_TITLE)
+        self.labelWelcomeTo.setFont(_FONT_TITLE)
         self.labelWelcomeTo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.horizontalLayoutTitle.addWidget(self.labelWelcomeTo)
 
         self.labelAppName = QLabel(WelcomeFrame)
         self.labelAppName.setObjectName("labelAppName")
-        sizePolicy.setHeightForWidth(self.labelAppName.sizePolicy().hasHeightForWidth())
-        self.labelAppName.setSizePolicy(sizePolicy)
-        self.labelAppName.setFont(font_title_bold)
+        self.labelAppName.setSizePolicy(_SP_TITLE)
+        self.labelAppName.setFont(_FONT_TITLE_BOLD)
         self.labelAppName.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.horizontalLayoutTitle.addWidget(self.labelAppName)
 
@@ -170,7 +199,7 @@ class WelcomeFrame(object):
         # Description label
         self.labelDesc = QLabel(WelcomeFrame)
         self.labelDesc.setObjectName("labelDesc")
-        self.labelDesc.setFont(font_desc)
+        self.labelDesc.setFont(_FONT_DESC)
         self.labelDesc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.verticalLayoutText.addWidget(self.labelDesc)
 
@@ -188,21 +217,11 @@ class WelcomeFrame(object):
 
         self.pushButtonLoad = QPushButton(WelcomeFrame)
         self.pushButtonLoad.setObjectName("pushButtonLoad")
-        sizePolicy = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
-        sizePolicy.setHorizontalStretch(76)
-        sizePolicy.setVerticalStretch(30)
-        sizePolicy.setHeightForWidth(
-            self.pushButtonLoad.sizePolicy().hasHeightForWidth()
-        )
-        self.pushButtonLoad.setSizePolicy(sizePolicy)
+        self.pushButtonLoad.setSizePolicy(_SP_LOAD_BUTTON)
         self.pushButtonLoad.setMinimumSize(QSize(0, 0))
         self.pushButtonLoad.setMaximumSize(QSize(100, 30))
         self.pushButtonLoad.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        icon = QIcon(":/icons/email_open.png")
-        icon.addFile(
-            ":/icons/email_open.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off
-        )
-        self.pushButtonLoad.setIcon(icon)
+        self.pushButtonLoad.setIcon(_get_load_button_icon())
         self.pushButtonLoad.setFlat(False)
         self.horizontalLayoutCTA.addWidget(self.pushButtonLoad)
 
@@ -12,27 +12,55 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Union
-import email.utils
+from typing import List, Optional, Union
+from email.utils import parsedate_to_datetime
+import math
 from datetime import datetime, timezone
+from functools import lru_cache
 from logger_config import (
     logger,
 )
 from typing import Optional
 from PySide6.QtWidgets import QLayout, QWidget, QLayoutItem
 
+# Units used by format_bytes, each 1024 times the previous one
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
 
 def parse_email_date(date_string: str) -> Optional[datetime]:
     """Parses an email date string into a timezone-aware datetime object."""
+    if not date_string:
+        return None
+    if isinstance(date_string, str):
+        # A trailing "(UTC)"-style comment is ignored by the parser anyway;
+        # dropping it first also lets "+0000 (UTC)" and "+0000 (GMT)" share
+        # one cache entry
+        comment_start = date_string.rfind(" (")
+        if comment_start > 0 and date_string.endswith(")"):
+            date_string = date_string[:comment_start]
+        return _parse_email_date_cached(date_string)
+    # e.g. an email.header.Header, which is not hashable
+    return _parse_email_date(date_string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_email_date_cached(date_string: str) -> Optional[datetime]:
+    # Mailing lists and threads repeat Date headers verbatim; datetimes are
+    # immutable, so handing out the cached instance is safe. Failures are
+    # cached too, so each bad string is only logged once.
+    return _parse_email_date(date_string)
+
+
+def _parse_email_date(date_string: str) -> Optional[datetime]:
     try:
-        dt = email.utils.parsedate_to_datetime(date_string)
+        dt = parsedate_to_datetime(date_string)
         # Ensure the result is always timezone-aware so that comparisons
         # between dates never mix offset-naive and offset-aware datetimes.
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
     except (TypeError, ValueError):
-        logger.warning(f"Could not parse date string: {date_string}")
+        logger.warning("Could not parse date string: %s", date_string)
         return None
 
 
@@ -40,39 +68,74 @@ def clear_layout(layout: Optional[QLayout]) -> None:
     if layout is None:
         return
 
-    while layout.count():
-        item = layout.takeAt(0)
+    # Nested layouts go on a worklist instead of being recursed into
+    pending: List[QLayout] = [layout]
+    widgets: List[QWidget] = []
+    while pending:
+        current = pending.pop()
+        # Take from the end so Qt never shifts the remaining items down
+        while count := current.count():
+            item = current.takeAt(count - 1)
+
+            if item is None:
+                continue
 
-        if item is None:
-            continue
+            widget: Optional[QWidget] = item.widget()
+            if widget is not None:
+                widgets.append(widget)
+                continue
 
-        widget: Optional[QWidget] = item.widget()
-        if widget is not None:
-            widget.deleteLater()
-            continue
+            child_layout: Optional[QLayout] = item.layout()
+            if child_layout is not None:
+                pending.append(child_layout)
+                continue
 
-        child_layout: Optional[QLayout] = item.layout()
-        if child_layout is not None:
-            clear_layout(child_layout)
-            child_layout.deleteLater()
-            continue
+            # Spacer items need nothing special, just let Qt GC them
 
-        spacer = item.spacerItem()
-        if spacer is not None:
-            # nothing special needed, just let Qt GC it
-            pass
+        if current is not layout:
+            current.deleteLater()
+
+    # Everything is detached from the layouts before any widget goes away
+    for widget in widgets:
+        widget.deleteLater()
 
 
 def format_bytes(size: Union[int, float], precision: int = 2) -> str:
+    # Exact type check: bools are ints but would share entries with 0 and 1
+    if type(size) is int:
+        return _format_bytes_cached(size, precision)
+    # Float sizes rarely repeat, so they are not worth a cache entry
+    return _format_bytes(size, precision)
+
+
+@lru_cache(maxsize=1024)
+def _format_bytes_cached(size: int, precision: int) -> str:
+    # Byte counts repeat a lot across a mailbox (empty parts, identical
+    # attachments). The cache is shared by the loader thread (building the
+    # display store) and the GUI thread (mail header, attachment list);
+    # functools.lru_cache is thread-safe, so that needs no locking. A
+    # negative size raises, and exceptions are not cached.
+    return _format_bytes(size, precision)
+
+
+def _format_bytes(size: Union[int, float], precision: int) -> str:
     if size < 0:
         raise ValueError("size must be non-negative")
 
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    value = float(size)
+    # Most sizes are under a megabyte; format those without the unit lookup
+    if size < 1024:
+        return f"{size:.{precision}f} B"
+    if size < 1048576:
+        return f"{size / 1024:.{precision}f} KB"
 
-    for unit in units:
-        if value < 1024.0:
-            return f"{value:.{precision}f} {unit}"
-        value /= 1024.0
-
-    return f"{value:.{precision}f} EB"
+    value = float(size)
+    if not math.isfinite(value):
+        # inf and nan have no binary exponent to pick a unit from; they
+        # end up in EB, the unit the old per-unit loop fell through to
+        return f"{value:.{precision}f} {_UNITS[-1]}"
+    # Each unit is 2**10 of the previous one, so the binary exponent of
+    # the value picks the unit directly; EB is the last one
+    idx = min((math.frexp(value)[1] - 1) // 10, len(_UNITS) - 1)
+    value /= 1 << (10 * idx)
+
+    return f"{value:.{precision}f} {_UNITS[idx]}"